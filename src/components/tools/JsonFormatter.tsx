@@ -8,7 +8,7 @@ import { LoadFileButton } from '@/components/ui/load-file-button';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
 import { DEFAULT_JSON_OPTIONS, JSON_EXAMPLES, JSON_FORMAT_OPTIONS } from '@/config/json-formatter-config';
 import { useCodeEditorTheme } from '@/hooks/useCodeEditorTheme';
-import { formatJson, getJsonStats, type JsonFormatOptions, type JsonFormatResult } from '@/libs/json-formatter';
+import { formatJson, type JsonFormatOptions, type JsonFormatResult, type JsonStats } from '@/libs/json-formatter';
 import { cn } from '@/libs/utils';
 import { ArrowPathIcon, ChevronDownIcon } from '@heroicons/react/24/outline';
 import { useEffect, useState } from 'react';
@@ -27,7 +27,7 @@ export function JsonFormatter({ className, instanceId }: JsonFormatterProps) {
   const [output, setOutput] = useState<string>('');
   const [isFormatting, setIsFormatting] = useState(false);
   const [error, setError] = useState<string>('');
-  const [stats, setStats] = useState<{ size: number; lines: number; depth: number; keys: number } | null>(null);
+  const [stats, setStats] = useState<JsonStats | null>(null);
   const [isHydrated, setIsHydrated] = useState(false);
 
   // Editor settings
@@ -43,7 +43,7 @@ export function JsonFormatter({ className, instanceId }: JsonFormatterProps) {
       if (toolState.input) setInput(toolState.input as string);
       if (toolState.output) setOutput(toolState.output as string);
       if (toolState.error) setError(toolState.error as string);
-      if (toolState.stats) setStats(toolState.stats as { size: number; lines: number; depth: number; keys: number });
+      if (toolState.stats) setStats(toolState.stats as JsonStats);
     }
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
@@ -90,7 +90,7 @@ export function JsonFormatter({ className, instanceId }: JsonFormatterProps) {
 
       if (result.isValid) {
         setOutput(result.formatted);
-        setStats(getJsonStats(result.formatted));
+        setStats(result.stats ?? null);
       } else {
         setError(result.error || 'Invalid JSON');
         setOutput('');
@@ -0,0 +1,94 @@
+import { decodeBase, encodeBase, type BaseEncodingType } from '@/libs/base-encoder';
+
+describe('base-encoder', () => {
+  describe('round trip', () => {
+    const types: BaseEncodingType[] = ['base64', 'base64url', 'base32', 'base32hex'];
+    const samples = ['a', 'ab', 'abc', 'Hello, World!', 'héllo ✓'];
+
+    types.forEach(encodingType => {
+      it(`should decode what it encodes for ${encodingType}`, () => {
+        samples.forEach(sample => {
+          const encoded = encodeBase(sample, { encodingType });
+          const decoded = decodeBase(encoded.encoded, { encodingType });
+
+          expect(decoded.isValid).toBe(true);
+          expect(decoded.decoded).toBe(sample);
+        });
+      });
+    });
+
+    it('should decode what it encodes for base85 whole groups', () => {
+      ['abcd', 'Hello World!'].forEach(sample => {
+        const encoded = encodeBase(sample, { encodingType: 'base85' });
+        const decoded = decodeBase(encoded.encoded, { encodingType: 'base85' });
+
+        expect(decoded.isValid).toBe(true);
+        expect(decoded.decoded).toBe(sample);
+      });
+    });
+  });
+
+  describe('decodeBase base64', () => {
+    it('should decode standard base64', () => {
+      expect(decodeBase('SGVsbG8=', { encodingType: 'base64' }).decoded).toBe('Hello');
+    });
+
+    it('should ignore = inside the data', () => {
+      const result = decodeBase('SGVs=bG8=', { encodingType: 'base64' });
+      expect(result.isValid).toBe(true);
+      expect(result.decoded).toBe('Hello');
+    });
+
+    it('should reject non-ASCII characters', () => {
+      const result = decodeBase('SGVésbG8=', { encodingType: 'base64' });
+      expect(result.isValid).toBe(false);
+      expect(result.error).toBe('Invalid Base64 character: é');
+    });
+
+    it('should reject characters from the other alphabet', () => {
+      expect(decodeBase('SGVsbG8_', { encodingType: 'base64' }).error)
+        .toBe('Invalid Base64 character: _');
+      expect(decodeBase('SGVsbG8/', { encodingType: 'base64url' }).error)
+        .toBe('Invalid Base64 character: /');
+    });
+  });
+
+  describe('decodeBase base32', () => {
+    it('should accept lowercase input', () => {
+      expect(decodeBase('jbswy3dp', { encodingType: 'base32' }).decoded).toBe('Hello');
+      expect(decodeBase('91imor3f', { encodingType: 'base32hex' }).decoded).toBe('Hello');
+    });
+
+    it('should reject characters outside the alphabet', () => {
+      const result = decodeBase('JBSWY1DP', { encodingType: 'base32' });
+      expect(result.isValid).toBe(false);
+      expect(result.error).toBe('Invalid Base32 character: 1');
+    });
+
+    it('should reject non-ASCII characters', () => {
+      const result = decodeBase('JBSWÉY3DP', { encodingType: 'base32' });
+      expect(result.isValid).toBe(false);
+      expect(result.error).toBe('Invalid Base32 character: É');
+    });
+  });
+
+  describe('decodeBase base85', () => {
+    it('should expand z runs to zero bytes', () => {
+      expect(decodeBase('zz', { encodingType: 'base85' }).decoded).toBe('\0'.repeat(8));
+      expect(decodeBase('z87cURD]i,"Ebo80', { encodingType: 'base85' }).decoded)
+        .toBe('\0\0\0\0Hello World!');
+    });
+
+    it('should reject characters outside the alphabet', () => {
+      const result = decodeBase('87cUR~', { encodingType: 'base85' });
+      expect(result.isValid).toBe(false);
+      expect(result.error).toBe('Invalid Base85 character: ~');
+    });
+
+    it('should reject non-ASCII characters', () => {
+      const result = decodeBase('87céUR', { encodingType: 'base85' });
+      expect(result.isValid).toBe(false);
+      expect(result.error).toBe('Invalid Base85 character: é');
+    });
+  });
+});
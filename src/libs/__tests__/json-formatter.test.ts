@@ -25,10 +25,25 @@ describe('JSON Formatter', () => {
       expect(result.formatted).toBe(formattedJson)
     })
 
+    it('should sort keys when beautifying', () => {
+      const asc = formatJson(validJson, { format: 'beautify', indentSize: 2, sortKeys: 'asc' })
+      expect(asc.formatted).toBe('{\n  "age": 30,\n  "city": "New York",\n  "name": "John"\n}')
+
+      const desc = formatJson(validJson, { format: 'beautify', indentSize: 2, sortKeys: 'desc' })
+      expect(desc.formatted).toBe('{\n  "name": "John",\n  "city": "New York",\n  "age": 30\n}')
+    })
+
+    it('should return statistics matching getJsonStats for the formatted output', () => {
+      const result = formatJson(validJson, { format: 'beautify', indentSize: 2, sortKeys: 'asc' })
+      expect(result.stats).toEqual(getJsonStats(result.formatted))
+      expect(result.stats?.lines).toBe(5)
+    })
+
     it('should return error for invalid JSON', () => {
       const result = formatJson(invalidJson, { format: 'beautify', indentSize: 2, sortKeys: 'none' })
       expect(result.isValid).toBe(false)
       expect(result.error).toBeDefined()
+      expect(result.stats).toBeUndefined()
     })
   })
 
@@ -1,4 +1,5 @@
-import { getUuidStats, getUuidVersion, isValidUuid } from '@/libs/uuid-generator';
+import { v5 as uuidv5 } from 'uuid';
+import { generateUuids, getUuidStats, getUuidVersion, isValidUuid } from '@/libs/uuid-generator';
 
 describe('UUID Generator Utility Functions', () => {
   describe('isValidUuid', () => {
@@ -109,4 +110,36 @@ describe('UUID Generator Utility Functions', () => {
       expect(stats.averageLength).toBe(32);
     });
   });
+
+  describe('generateUuids', () => {
+    it('should generate the requested quantity with formatting applied', () => {
+      const result = generateUuids({ version: 'v4', format: 'uppercase', hyphens: 'exclude', quantity: 3 });
+
+      expect(result.uuids).toHaveLength(3);
+      result.uuids.forEach(uuid => expect(uuid).toMatch(/^[0-9A-F]{32}$/));
+    });
+
+    it('should hash a v5 namespace and name once per batch', () => {
+      (uuidv5 as unknown as jest.Mock).mockClear();
+
+      const result = generateUuids({
+        version: 'v5',
+        format: 'lowercase',
+        hyphens: 'include',
+        quantity: 5,
+        namespace: '6ba7b810-9dad-11d1-80b4-00c04fd430c8',
+        name: 'devpockit'
+      });
+
+      expect(uuidv5).toHaveBeenCalledTimes(1);
+      expect(new Set(result.uuids).size).toBe(1);
+      expect(result.uuids).toHaveLength(5);
+    });
+
+    it('should require namespace and name for v5', () => {
+      expect(() =>
+        generateUuids({ version: 'v5', format: 'lowercase', hyphens: 'include', quantity: 2 })
+      ).toThrow('Namespace and name are required for v5 UUIDs');
+    });
+  });
 });
@@ -47,6 +47,37 @@ const BASE16_UPPER = '0123456789ABCDEF';
 // Base85 (Ascii85) character set
 const BASE85_CHARS = '!"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstu';
 
+// Marks characters outside an alphabet in the decode tables below
+const INVALID_DIGIT = 0xFF;
+
+/**
+ * Build an ASCII char code -> digit table for an alphabet
+ */
+function buildDecodeTable(alphabet: string): Uint8Array {
+  const table = new Uint8Array(128).fill(INVALID_DIGIT);
+
+  for (let i = 0; i < alphabet.length; i++) {
+    table[alphabet.charCodeAt(i)] = i;
+  }
+
+  return table;
+}
+
+// Decode tables, built once instead of on every decode call
+const BASE64_STANDARD_TABLE = buildDecodeTable(BASE64_STANDARD);
+const BASE64_URL_SAFE_TABLE = buildDecodeTable(BASE64_URL_SAFE);
+const BASE32_STANDARD_TABLE = buildDecodeTable(BASE32_STANDARD);
+const BASE32_HEX_TABLE = buildDecodeTable(BASE32_HEX);
+const BASE85_TABLE = buildDecodeTable(BASE85_CHARS);
+
+/**
+ * Look up a character's digit value, returning INVALID_DIGIT for non-alphabet characters
+ */
+function decodeDigit(table: Uint8Array, char: string): number {
+  const code = char.charCodeAt(0);
+  return code < 128 ? table[code] : INVALID_DIGIT;
+}
+
 /**
  * Convert string to Uint8Array
  */
@@ -100,12 +131,7 @@ function encodeBase64Internal(data: Uint8Array, urlSafe: boolean, padding: boole
  * Decode Base64 (standard or URL-safe)
  */
 function decodeBase64Internal(encoded: string, urlSafe: boolean): Uint8Array {
-  const alphabet = urlSafe ? BASE64_URL_SAFE : BASE64_STANDARD;
-  const lookup: Record<string, number> = {};
-
-  for (let i = 0; i < alphabet.length; i++) {
-    lookup[alphabet[i]] = i;
-  }
+  const table = urlSafe ? BASE64_URL_SAFE_TABLE : BASE64_STANDARD_TABLE;
 
   // Remove padding and whitespace
   encoded = encoded.replace(/[=\s]/g, '');
@@ -115,8 +141,8 @@ function decodeBase64Internal(encoded: string, urlSafe: boolean): Uint8Array {
   let bitsCollected = 0;
 
   for (const char of encoded) {
-    const value = lookup[char];
-    if (value === undefined) {
+    const value = decodeDigit(table, char);
+    if (value === INVALID_DIGIT) {
       throw new Error(`Invalid Base64 character: ${char}`);
     }
 
@@ -168,12 +194,7 @@ function encodeBase32Internal(data: Uint8Array, hex: boolean): string {
  * Decode Base32
  */
 function decodeBase32Internal(encoded: string, hex: boolean): Uint8Array {
-  const alphabet = hex ? BASE32_HEX : BASE32_STANDARD;
-  const lookup: Record<string, number> = {};
-
-  for (let i = 0; i < alphabet.length; i++) {
-    lookup[alphabet[i]] = i;
-  }
+  const table = hex ? BASE32_HEX_TABLE : BASE32_STANDARD_TABLE;
 
   // Remove padding and whitespace, convert to uppercase
   encoded = encoded.replace(/[=\s]/g, '').toUpperCase();
@@ -183,8 +204,8 @@ function decodeBase32Internal(encoded: string, hex: boolean): Uint8Array {
   let bitsCollected = 0;
 
   for (const char of encoded) {
-    const value = lookup[char];
-    if (value === undefined) {
+    const value = decodeDigit(table, char);
+    if (value === INVALID_DIGIT) {
       throw new Error(`Invalid Base32 character: ${char}`);
     }
 
@@ -285,12 +306,6 @@ function encodeBase85Internal(data: Uint8Array): string {
  * Decode Base85 (Ascii85)
  */
 function decodeBase85Internal(encoded: string): Uint8Array {
-  const lookup: Record<string, number> = {};
-
-  for (let i = 0; i < BASE85_CHARS.length; i++) {
-    lookup[BASE85_CHARS[i]] = i;
-  }
-
   // Remove whitespace
   encoded = encoded.replace(/\s/g, '');
 
@@ -311,8 +326,8 @@ function decodeBase85Internal(encoded: string): Uint8Array {
       const char = encoded[i + j];
       if (char === 'z') break;
 
-      const digit = lookup[char];
-      if (digit === undefined) {
+      const digit = decodeDigit(BASE85_TABLE, char);
+      if (digit === INVALID_DIGIT) {
         throw new Error(`Invalid Base85 character: ${char}`);
       }
 
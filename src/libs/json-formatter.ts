@@ -9,6 +9,13 @@ export interface JsonFormatOptions {
   sortKeys: 'none' | 'asc' | 'desc';
 }
 
+export interface JsonStats {
+  size: number;
+  lines: number;
+  depth: number;
+  keys: number;
+}
+
 export interface JsonFormatResult {
   formatted: string;
   isValid: boolean;
@@ -16,6 +23,8 @@ export interface JsonFormatResult {
   originalSize: number;
   formattedSize: number;
   compressionRatio?: number;
+  // Statistics for `formatted`; present only when isValid is true
+  stats?: JsonStats;
 }
 
 /**
@@ -33,16 +42,12 @@ export function formatJson(jsonString: string, options: JsonFormatOptions): Json
     if (options.format === 'minify') {
       formatted = JSON.stringify(parsed);
     } else {
-      // Beautify with custom indentation
-      const indent = ' '.repeat(options.indentSize);
-      formatted = JSON.stringify(parsed, null, indent);
-    }
+      // Sort keys before serializing so the document is only stringified once
+      const value = options.sortKeys !== 'none' ? sortObjectKeys(parsed, options.sortKeys) : parsed;
 
-    // Sort keys if requested
-    if (options.sortKeys !== 'none' && options.format === 'beautify') {
-      const sortedParsed = sortObjectKeys(parsed, options.sortKeys);
+      // Beautify with custom indentation
       const indent = ' '.repeat(options.indentSize);
-      formatted = JSON.stringify(sortedParsed, null, indent);
+      formatted = JSON.stringify(value, null, indent);
     }
 
     const formattedSize = formatted.length;
@@ -53,7 +58,9 @@ export function formatJson(jsonString: string, options: JsonFormatOptions): Json
       isValid: true,
       originalSize,
       formattedSize,
-      compressionRatio: options.format === 'minify' ? compressionRatio : undefined
+      compressionRatio: options.format === 'minify' ? compressionRatio : undefined,
+      // Reuse the parsed value rather than re-parsing the formatted output
+      stats: buildJsonStats(formatted, parsed)
     };
 
   } catch (error) {
@@ -113,23 +120,36 @@ export function sortObjectKeys(obj: any, sortOrder: 'asc' | 'desc'): any {
 /**
  * Get JSON statistics
  */
-export function getJsonStats(jsonString: string): {
-  size: number;
-  lines: number;
-  depth: number;
-  keys: number;
-} {
-  const size = jsonString.length;
-  const lines = jsonString.split('\n').length;
-
+export function getJsonStats(jsonString: string): JsonStats {
   try {
-    const parsed = JSON.parse(jsonString);
-    const { depth, keys } = analyzeJsonStructure(parsed);
-
-    return { size, lines, depth, keys };
+    return buildJsonStats(jsonString, JSON.parse(jsonString));
   } catch {
-    return { size, lines, depth: 0, keys: 0 };
+    return { size: jsonString.length, lines: countLines(jsonString), depth: 0, keys: 0 };
+  }
+}
+
+/**
+ * Build statistics for a JSON string from its already-parsed value
+ */
+function buildJsonStats(jsonString: string, parsed: any): JsonStats {
+  const { depth, keys } = analyzeJsonStructure(parsed);
+
+  return { size: jsonString.length, lines: countLines(jsonString), depth, keys };
+}
+
+/**
+ * Count lines without materializing a split array of the whole document
+ */
+function countLines(text: string): number {
+  let lines = 1;
+  let index = text.indexOf('\n');
+
+  while (index !== -1) {
+    lines++;
+    index = text.indexOf('\n', index + 1);
   }
+
+  return lines;
 }
 
 /**
@@ -22,40 +22,40 @@ export interface UuidGenerationResult {
   totalLength: number
 }
 
+const UUID_REGEX = /^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i
+
 /**
- * Generate a single UUID based on version and format
+ * Resolve the raw UUID generator for a version, validating its inputs once
  */
-export function generateSingleUuid(
-  version: UuidVersion,
-  format: UuidFormat,
-  hyphens: UuidHyphens,
-  namespace?: string,
-  name?: string
-): string {
-  let uuid: string
-
+function getUuidGenerator(version: UuidVersion, namespace?: string, name?: string): () => string {
   switch (version) {
     case 'v1':
-      uuid = uuidv1()
-      break
+      return () => uuidv1()
     case 'v4':
-      uuid = uuidv4()
-      break
-    case 'v5':
+      return () => uuidv4()
+    case 'v5': {
       if (!namespace || !name) {
         throw new Error('Namespace and name are required for v5 UUIDs')
       }
-      uuid = uuidv5(name, namespace)
-      break
+      // v5 is deterministic for a given namespace and name, so hash once per batch
+      const uuid = uuidv5(name, namespace)
+      return () => uuid
+    }
     case 'v7':
-      uuid = uuidv7()
-      break
+      return () => uuidv7()
     default:
       throw new Error(`Unsupported UUID version: ${version}`)
   }
+}
 
-  // Apply format (uppercase/lowercase)
-  uuid = format === 'uppercase' ? uuid.toUpperCase() : uuid.toLowerCase()
+/**
+ * Apply case and hyphen options to a generated UUID
+ */
+function applyUuidFormat(uuid: string, format: UuidFormat, hyphens: UuidHyphens): string {
+  // Apply format; the uuid library already emits lowercase hex
+  if (format === 'uppercase') {
+    uuid = uuid.toUpperCase()
+  }
 
   // Apply hyphen option
   if (hyphens === 'exclude') {
@@ -65,6 +65,20 @@ export function generateSingleUuid(
   return uuid
 }
 
+/**
+ * Generate a single UUID based on version and format
+ */
+export function generateSingleUuid(
+  version: UuidVersion,
+  format: UuidFormat,
+  hyphens: UuidHyphens,
+  namespace?: string,
+  name?: string
+): string {
+  const generate = getUuidGenerator(version, namespace, name)
+  return applyUuidFormat(generate(), format, hyphens)
+}
+
 /**
  * Generate multiple UUIDs with the same options
  */
@@ -75,11 +89,12 @@ export function generateUuids(options: UuidGenerationOptions): UuidGenerationRes
     throw new Error('Quantity must be between 1 and 100')
   }
 
+  // Resolve the generator once per batch rather than once per UUID
+  const generate = getUuidGenerator(version, namespace, name)
   const uuids: string[] = []
 
   for (let i = 0; i < quantity; i++) {
-    const uuid = generateSingleUuid(version, format, hyphens, namespace, name)
-    uuids.push(uuid)
+    uuids.push(applyUuidFormat(generate(), format, hyphens))
   }
 
   const totalLength = uuids.join('\n').length
@@ -98,8 +113,7 @@ export function generateUuids(options: UuidGenerationOptions): UuidGenerationRes
  * Validate UUID format
  */
 export function isValidUuid(uuid: string): boolean {
-  const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i
-  return uuidRegex.test(uuid)
+  return UUID_REGEX.test(uuid)
 }
 
 /**